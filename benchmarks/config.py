@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
+import functools
+import json
 import math
 import os
+from pathlib import Path
 import shutil
-from typing import Optional, Tuple
+import tempfile
+from typing import Dict, List, Optional, Tuple
 
-from .openmc_runner import OpenMCRunner
+from .openmc_runner import OpenMCBuildInfo, OpenMCRunner, _build_info_key
 
 
+@functools.lru_cache(maxsize=None)
 def _detect_mpi_runner() -> Optional[Tuple[str, ...]]:
     for candidate in ("mpirun", "mpiexec"):
         if shutil.which(candidate):
@@ -20,16 +25,73 @@ def _detect_mpi_runner() -> Optional[Tuple[str, ...]]:
 _MPI_RUNNER = _detect_mpi_runner()
 
 
-def _detect_mpi_enabled() -> bool:
-    runner = OpenMCRunner(default_mpi_runner=_MPI_RUNNER)
+# ``openmc -v`` output is cached on disk so that the many processes asv spawns
+# during discovery and benchmarking don't each have to launch OpenMC. Entries
+# are keyed on the resolved executable path and its modification time.
+_BUILD_INFO_CACHE_FILE = Path.home() / ".cache" / "openmc-bench" / "build_info.json"
+
+
+def _load_cached_build_info(key: List[object]) -> Optional[Dict[str, str]]:
     try:
-        build_info = runner._get_build_info(runner.openmc_exec, os.environ)
-    except Exception:
-        return True
-    return runner._build_supports_mpi(build_info)
+        with _BUILD_INFO_CACHE_FILE.open("r", encoding="utf-8") as fh:
+            cached = json.load(fh)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("key") != key:
+        return None
+    return cached.get("build_info")
 
 
-_MPI_ENABLED = _detect_mpi_enabled()
+def _store_cached_build_info(key: List[object], raw: Dict[str, str]) -> None:
+    try:
+        _BUILD_INFO_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file and rename so that concurrent asv
+        # processes never observe a partially written cache
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=_BUILD_INFO_CACHE_FILE.parent, delete=False
+        ) as fh:
+            json.dump({"key": key, "build_info": raw}, fh)
+        os.replace(fh.name, _BUILD_INFO_CACHE_FILE)
+    except OSError:
+        pass
+
+
+@functools.lru_cache(maxsize=None)
+def _detect_mpi_enabled() -> bool:
+    # An explicit hint avoids launching OpenMC at all
+    hint = os.environ.get("OPENMC_BENCH_MPI_ENABLED", "").strip().lower()
+    if hint in {"1", "yes", "true"}:
+        return True
+    if hint in {"0", "no", "false"}:
+        return False
+    if hint:
+        raise ValueError(
+            "OPENMC_BENCH_MPI_ENABLED must be one of 1/yes/true or 0/no/false, "
+            f"got {os.environ['OPENMC_BENCH_MPI_ENABLED']!r}"
+        )
+
+    # JSON round-trips the (path, mtime) key as a list
+    key = _build_info_key("openmc")
+    key = list(key) if key is not None else None
+    raw = _load_cached_build_info(key) if key is not None else None
+    if raw is None:
+        runner = OpenMCRunner(default_mpi_runner=_MPI_RUNNER)
+        try:
+            build_info = runner._get_build_info(runner.openmc_exec, os.environ)
+        except Exception:
+            return True
+        if build_info is None:
+            return runner._build_supports_mpi(None)
+        raw = build_info.raw
+        if key is not None:
+            _store_cached_build_info(key, raw)
+    return OpenMCRunner._build_supports_mpi(OpenMCBuildInfo(raw=raw))
+
+
+# MPI configurations are opt-in since they double the sweep; the build probe
+# only runs when they are requested
+_MPI_REQUESTED = os.environ.get("OPENMC_BENCH_MPI") == "1"
+_MPI_ENABLED = _MPI_REQUESTED and _MPI_RUNNER is not None and _detect_mpi_enabled()
 
 # Explicit list of (threads, MPI procs) configurations to benchmark
 _CONFIGS: Tuple[Tuple[int, Optional[int]], ...] = (
@@ -37,7 +99,7 @@ _CONFIGS: Tuple[Tuple[int, Optional[int]], ...] = (
     (12, None),
     (48, None),
 )
-if _MPI_ENABLED and _MPI_RUNNER:
+if _MPI_ENABLED:
     _CONFIGS += (
         (1, 48),
         (4, 12),
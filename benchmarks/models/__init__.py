@@ -1,38 +1,138 @@
-"""Auto-discover OpenMC model builders for benchmarks."""
+"""Auto-discover OpenMC model builders for benchmarks.
+
+Model modules are not imported during discovery when their metadata can be
+read statically. ``BENCHMARK_NAME``, ``CONFIGS``, ``CUSTOM_METRICS`` and
+``MODEL_COST`` are taken from literal module-level assignments, and the module itself is only
+imported when its builder is first called. Modules whose metadata is computed
+at import time (e.g. ``CUSTOM_METRICS`` mapping to functions) are imported
+eagerly as before.
+
+Models that set ``MODEL_COST = "light"`` run only a single-threaded serial
+configuration unless they also set ``CONFIGS``; scaling sweeps of sub-second
+problems are dominated by noise. Unannotated (or ``"heavy"``) models use the
+default configuration sweep.
+"""
 
 from __future__ import annotations
 
+import ast
+import functools
 import importlib
 import pkgutil
-from typing import Callable, Dict, Optional, Tuple
+from pathlib import Path
+from types import ModuleType
+from typing import TYPE_CHECKING, Callable, Dict, Optional, Tuple
 
-import openmc
+if TYPE_CHECKING:
+    import openmc
 
-ModelBuilder = Callable[[], openmc.Model]
+ModelBuilder = Callable[[], "openmc.Model"]
 CustomMetrics = Optional[Dict[str, Callable]]
 ModelSpec = Tuple[str, ModelBuilder, Optional[Tuple[int, ...]], Optional[Tuple[Optional[int], ...]], CustomMetrics]
 
 # Mapping of module name -> ModelSpec
 MODEL_REGISTRY: Dict[str, ModelSpec] = {}
 
+_METADATA_NAMES = ("BENCHMARK_NAME", "CONFIGS", "CUSTOM_METRICS", "MODEL_COST")
+
+# Configurations used for models declaring MODEL_COST = "light"
+_LIGHT_CONFIGS: Tuple[Tuple[int, Optional[int]], ...] = ((1, None),)
+
 
 def _default_benchmark_name(module_name: str) -> str:
     parts = module_name.split("_")
     return "".join(part.capitalize() for part in parts)
 
 
+@functools.lru_cache(maxsize=None)
+def _lazy_import(module_name: str) -> ModuleType:
+    module = importlib.import_module(f"{__name__}.{module_name}")
+    # Importing a submodule rebinds the package attribute of the same name;
+    # keep exporting the registered builder instead
+    if module_name in MODEL_REGISTRY:
+        globals()[module_name] = MODEL_REGISTRY[module_name][1]
+    return module
+
+
+def _lazy_builder(module_name: str) -> ModelBuilder:
+    def build_model():
+        return _lazy_import(module_name).build_model()
+
+    build_model.__qualname__ = f"{module_name}.build_model"
+    return build_model
+
+
+def _read_static_metadata(path: Path) -> Optional[Dict[str, object]]:
+    """Return literal module metadata, or ``None`` if the module must be imported."""
+    try:
+        tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    except (OSError, SyntaxError):
+        return None
+
+    metadata: Dict[str, object] = {}
+    has_builder = False
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef) and node.name == "build_model":
+            has_builder = True
+            continue
+        if isinstance(node, ast.Assign):
+            targets = node.targets
+        elif isinstance(node, ast.AnnAssign) and node.value is not None:
+            targets = [node.target]
+        else:
+            targets = []
+        names = [t.id for t in targets if isinstance(t, ast.Name) and t.id in _METADATA_NAMES]
+        if names and all(isinstance(t, ast.Name) for t in targets):
+            try:
+                value = ast.literal_eval(node.value)
+            except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+                return None
+            metadata.update(dict.fromkeys(names, value))
+        elif _binds_metadata(node):
+            # Bound some other way (augmented, unpacked, conditional, ...)
+            return None
+    return metadata if has_builder else None
+
+
+def _binds_metadata(node: ast.AST) -> bool:
+    """Return whether *node* binds any metadata name anywhere within it."""
+    for child in ast.walk(node):
+        if isinstance(child, ast.Name) and isinstance(child.ctx, ast.Store):
+            name = child.id
+        elif isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            name = child.name
+        elif isinstance(child, ast.alias):
+            name = child.asname or child.name
+        else:
+            continue
+        if name in _METADATA_NAMES:
+            return True
+    return False
+
+
 def _discover() -> None:
-    package = __name__
     for module_info in pkgutil.iter_modules(__path__):
         if module_info.name.startswith("_"):
             continue
-        module = importlib.import_module(f"{package}.{module_info.name}")
-        builder = getattr(module, "build_model", None)
-        if builder is None:
-            continue
-        benchmark_name = getattr(module, "BENCHMARK_NAME", _default_benchmark_name(module_info.name))
-        configs = getattr(module, "CONFIGS", None)
-        custom_metrics = getattr(module, "CUSTOM_METRICS", None)
+        metadata = None
+        if not module_info.ispkg:
+            path = Path(module_info.module_finder.path) / f"{module_info.name}.py"
+            metadata = _read_static_metadata(path)
+
+        if metadata is not None:
+            builder = _lazy_builder(module_info.name)
+        else:
+            module = _lazy_import(module_info.name)
+            builder = getattr(module, "build_model", None)
+            if builder is None:
+                continue
+            metadata = {name: getattr(module, name, None) for name in _METADATA_NAMES}
+
+        benchmark_name = metadata.get("BENCHMARK_NAME") or _default_benchmark_name(module_info.name)
+        configs = metadata.get("CONFIGS")
+        if configs is None and metadata.get("MODEL_COST") == "light":
+            configs = _LIGHT_CONFIGS
+        custom_metrics = metadata.get("CUSTOM_METRICS")
         MODEL_REGISTRY[module_info.name] = (benchmark_name, builder, configs, custom_metrics)
 
 
@@ -2,11 +2,20 @@
 
 from __future__ import annotations
 
+from itertools import pairwise
+
 import openmc
-import numpy as np
 
 
 def build_model(add_tallies : bool) -> openmc.Model:
+    """Build the ten-slab many-nuclide model.
+
+    Each slab is filled with its own clone of the fuel material. Sharing one
+    material would give the same physics, but the clones are deliberate: they
+    keep ten copies of the ~250-nuclide composition in memory, which is the
+    workload CrossSectionLookups and DepletionTallies have always measured,
+    so their results stay comparable with the recorded history.
+    """
     # Define materials
     fuel = openmc.Material(name='Fuel')
     fuel.set_density('g/cm3', 10.062)
@@ -89,13 +98,9 @@ def build_model(add_tallies : bool) -> openmc.Model:
     # other reaction products from (n,p), (n,a), etc.
     reaction_products = ['H1', 'H2', 'H3', 'He3', 'He4']
 
-    fuel.add_components(components)
-    for nuc in fission_products:
-        fuel.add_nuclide(nuc, 1.0e-12)
-    for nuc in minor_actinides:
-        fuel.add_nuclide(nuc, 1.0e-12)
-    for nuc in reaction_products:
-        fuel.add_nuclide(nuc, 1.0e-12)
+    # trace amounts of everything else, added in the same call
+    trace = {nuc: 1.0e-12 for nuc in (*fission_products, *minor_actinides, *reaction_products)}
+    fuel.add_components({**components, **trace})
 
     # Create materials - 10 clones of the fuel material
     materials = openmc.Materials([fuel])
@@ -103,27 +108,25 @@ def build_model(add_tallies : bool) -> openmc.Model:
         materials.append(fuel.clone())
 
     # Create geometry - 10 slab cells with reflective boundaries on outer surfaces
-    geometry = openmc.Geometry()
-
     # Define surfaces for slab boundaries
     zmin = -10.0
     zmax = 10.0
     n = 10
 
     # generate n+1 plane positions evenly spaced between zmin and zmax
-    positions = np.linspace(zmin, zmax, n + 1)
+    step = (zmax - zmin) / n
+    positions = [zmin + i * step for i in range(n)] + [zmax]
     z_planes = [openmc.ZPlane(z) for z in positions]
 
     # Set reflective boundary conditions on outer surfaces
     z_planes[0].boundary_type = 'reflective'
     z_planes[-1].boundary_type = 'reflective'
 
-    # Create cells
-    cells = []
-    for i in range(10):
-        region = +z_planes[i] & -z_planes[i + 1]
-        cell = openmc.Cell(fill=materials[i], region=region)
-        cells.append(cell)
+    # Create cells, one per pair of adjacent planes
+    cells = [
+        openmc.Cell(fill=fill, region=+lower & -upper)
+        for fill, (lower, upper) in zip(materials, pairwise(z_planes))
+    ]
     geometry = openmc.Geometry(cells)
 
     # Settings with uniform source distribution over the slab
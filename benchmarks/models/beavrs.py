@@ -4,6 +4,7 @@ from pathlib import Path
 import openmc
 
 BENCHMARK_NAME = "BEAVRS"
+MODEL_COST = "heavy"
 
 
 def build_model() -> openmc.Model:
@@ -1,11 +1,16 @@
 """Repeated slabs with many nuclides"""
 
-import openmc
+from __future__ import annotations
 
-from . import _many_nuclides
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import openmc
 
 BENCHMARK_NAME = "CrossSectionLookups"
 
 
 def build_model() -> openmc.Model:
+    from . import _many_nuclides
+
     return _many_nuclides.build_model(add_tallies=False)
@@ -2,12 +2,55 @@
 
 from __future__ import annotations
 
-import openmc
+import os
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import openmc
 
 BENCHMARK_NAME = "InfiniteMediumEigenvalue"
+MODEL_COST = "light"
+
+
+def _problem_size() -> tuple[int, int, int]:
+    """Return (batches, inactive, particles), overridable from the environment.
+
+    ``ASV_QUICK=1`` switches to a smaller default problem; the individual
+    ``OPENMC_BENCH_BATCHES``, ``OPENMC_BENCH_INACTIVE`` and
+    ``OPENMC_BENCH_PARTICLES`` variables take precedence over either default.
+    """
+    if os.environ.get("ASV_QUICK") == "1":
+        defaults = (5, 1, 200)
+    else:
+        defaults = (20, 5, 1000)
+    names = ("OPENMC_BENCH_BATCHES", "OPENMC_BENCH_INACTIVE", "OPENMC_BENCH_PARTICLES")
+    values = []
+    for name, default in zip(names, defaults):
+        raw = os.environ.get(name)
+        if raw is None:
+            values.append(default)
+            continue
+        try:
+            value = int(raw)
+        except ValueError:
+            raise ValueError(f"{name} must be an integer, got {raw!r}") from None
+        # Inactive batches may be zero; the others must be positive
+        minimum = 0 if name == "OPENMC_BENCH_INACTIVE" else 1
+        if value < minimum:
+            raise ValueError(f"{name} must be at least {minimum}, got {value}")
+        values.append(value)
+    batches, inactive, particles = values
+    if inactive >= batches:
+        raise ValueError(
+            f"OPENMC_BENCH_INACTIVE ({inactive}) must be less than "
+            f"OPENMC_BENCH_BATCHES ({batches})"
+        )
+    return batches, inactive, particles
 
 
 def build_model() -> openmc.Model:
+    import openmc
+
     fuel = openmc.Material(name="UO2 fuel")
     fuel.add_element("U", 1, enrichment=4.5)
     fuel.add_element("O", 2)
@@ -22,10 +65,11 @@ def build_model() -> openmc.Model:
     source.angle = openmc.stats.Isotropic()
     source.energy = openmc.stats.delta_function(2.0e6)
 
+    batches, inactive, particles = _problem_size()
     settings = openmc.Settings()
-    settings.batches = 20
-    settings.inactive = 5
-    settings.particles = 1000
+    settings.batches = batches
+    settings.inactive = inactive
+    settings.particles = particles
     settings.run_mode = "eigenvalue"
     settings.source = source
 
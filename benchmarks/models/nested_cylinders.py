@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
-import openmc
-import numpy as np
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import openmc
 
 BENCHMARK_NAME = "NestedCylinders"
 
 
 def build_model() -> openmc.Model:
+    import openmc
+
     # Create a simple low-density hydrogen material (effectively vacuum)
     mat = openmc.Material(name='Low-density H')
     mat.add_nuclide('H1', 1.0)
@@ -22,7 +26,8 @@ def build_model() -> openmc.Model:
     z_max = 50.0
 
     # Generate radii for shells (linearly spaced)
-    radii = np.linspace(r_inner, r_outer, n_shells + 1)
+    step = (r_outer - r_inner) / n_shells
+    radii = [r_inner + i * step for i in range(n_shells)] + [r_outer]
 
     # Create cylindrical surfaces (infinite Z cylinders)
     cylinders = [openmc.ZCylinder(r=r) for r in radii]
@@ -34,18 +39,13 @@ def build_model() -> openmc.Model:
     # Set vacuum boundary on outermost cylinder
     cylinders[-1].boundary_type = 'vacuum'
 
-    # Create cells
-    cells = []
-    for i in range(n_shells + 1):
-        if i == 0:
-            # Innermost cell
-            region = -cylinders[i] & +z_bottom & -z_top
-        else:
-            # Shell cells
-            region = +cylinders[i - 1] & -cylinders[i] & +z_bottom & -z_top
-
-        cell = openmc.Cell(fill=mat, region=region)
-        cells.append(cell)
+    # Create cells: the innermost cylinder and each shell between consecutive
+    # cylinders (subdivide's last region, outside all cylinders, is unused),
+    # bounded in z
+    cells = [
+        openmc.Cell(fill=mat, region=region & +z_bottom & -z_top)
+        for region in openmc.model.subdivide(cylinders)[:-1]
+    ]
 
     geometry = openmc.Geometry(cells)
 
@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
-import openmc
-import numpy as np
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import openmc
 
 BENCHMARK_NAME = "NestedSpheres"
 
 
 def build_model() -> openmc.Model:
+    import openmc
+
     # Create a simple low-density hydrogen material (effectively vacuum)
     mat = openmc.Material(name='Low-density H')
     mat.add_nuclide('H1', 1.0)
@@ -20,7 +24,8 @@ def build_model() -> openmc.Model:
     r_outer = 100.0
 
     # Generate radii for shells (linearly spaced)
-    radii = np.linspace(r_inner, r_outer, n_shells + 1)
+    step = (r_outer - r_inner) / n_shells
+    radii = [r_inner + i * step for i in range(n_shells)] + [r_outer]
 
     # Create spherical surfaces
     spheres = [openmc.Sphere(r=r) for r in radii]
@@ -28,18 +33,12 @@ def build_model() -> openmc.Model:
     # Set vacuum boundary on outermost sphere
     spheres[-1].boundary_type = 'vacuum'
 
-    # Create cells
-    cells = []
-    for i in range(n_shells + 1):
-        if i == 0:
-            # Innermost cell
-            region = -spheres[i]
-        else:
-            # Shell cells
-            region = +spheres[i - 1] & -spheres[i]
-
-        cell = openmc.Cell(fill=mat, region=region)
-        cells.append(cell)
+    # Create cells: the innermost sphere and each shell between consecutive
+    # spheres (subdivide's last region, outside all spheres, is unused)
+    cells = [
+        openmc.Cell(fill=mat, region=region)
+        for region in openmc.model.subdivide(spheres)[:-1]
+    ]
 
     geometry = openmc.Geometry(cells)
 
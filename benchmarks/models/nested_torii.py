@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
-import openmc
-import numpy as np
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import openmc
 
 BENCHMARK_NAME = "NestedTorii"
 
 
 def build_model() -> openmc.Model:
+    import openmc
+
     # Create a simple low-density hydrogen material (effectively vacuum)
     mat = openmc.Material(name='Low-density H')
     mat.add_nuclide('H1', 1.0)
@@ -21,7 +25,8 @@ def build_model() -> openmc.Model:
     minor_radius_outer = 20.0  # Outer tube radius
 
     # Generate minor radii for shells (linearly spaced)
-    minor_radii = np.linspace(minor_radius_inner, minor_radius_outer, n_shells + 1)
+    step = (minor_radius_outer - minor_radius_inner) / n_shells
+    minor_radii = [minor_radius_inner + i * step for i in range(n_shells)] + [minor_radius_outer]
 
     # Create toroidal surfaces (Z-axis torus)
     torii = [openmc.ZTorus(a=major_radius, b=b, c=b) for b in minor_radii]
@@ -30,22 +35,13 @@ def build_model() -> openmc.Model:
     bounding_sphere = openmc.Sphere(r=major_radius + minor_radius_outer + 10.0,
                                      boundary_type='vacuum')
 
-    # Create cells
-    cells = []
-    for i in range(n_shells + 1):
-        if i == 0:
-            # Innermost cell (inside first torus)
-            region = -torii[i] & -bounding_sphere
-        else:
-            # Shell cells (between consecutive torii)
-            region = +torii[i - 1] & -torii[i] & -bounding_sphere
-
-        cell = openmc.Cell(fill=mat, region=region)
-        cells.append(cell)
-
-    # Add outermost cell (outside last torus but inside bounding sphere)
-    outer_cell = openmc.Cell(fill=mat, region=+torii[-1] & -bounding_sphere)
-    cells.append(outer_cell)
+    # Create cells: inside the first torus, each shell between consecutive
+    # torii and the region outside the last torus, all inside the bounding
+    # sphere
+    cells = [
+        openmc.Cell(fill=mat, region=region & -bounding_sphere)
+        for region in openmc.model.subdivide(torii)
+    ]
 
     geometry = openmc.Geometry(cells)
 
@@ -1,27 +1,43 @@
-"""Utilities for running OpenMC benchmarks under ``/usr/bin/time -v``.
+"""Utilities for running OpenMC benchmarks and measuring their resource usage.
 
 These helpers focus on reproducible collection of CPU and memory metrics when
 executing OpenMC jobs from ASV benchmarks. They assume that ``openmc`` is
-available on ``PATH`` and that the GNU ``time`` executable lives at
-``/usr/bin/time`` by default.
+available on ``PATH``. Usage is read from ``os.wait4`` on the child where
+available, falling back to running under GNU ``time -v``.
+
+Each run exports its XML inputs and writes its outputs under a fresh temporary
+directory. On CI hosts, pointing ``TMPDIR`` at a ``tmpfs`` mount (or mounting
+``/tmp`` as one) keeps that I/O in memory.
 """
 
 from __future__ import annotations
 
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
 from dataclasses import dataclass, field
+import functools
 import os
 import re
 from pathlib import Path
 import shutil
 import subprocess
+import sys
 import tempfile
 import threading
-from typing import Dict, List, Mapping, MutableMapping, Optional, Pattern, Sequence
+import time
+from typing import Dict, Iterator, List, Mapping, MutableMapping, MutableSequence, Optional, Pattern, Sequence, Set, Tuple
+import xml.etree.ElementTree as ET
 
 
-@dataclass
+@dataclass(slots=True)
 class TimeUsage:
-    """Parsed output from ``time -v`` describing resource usage."""
+    """Resource usage of one run.
+
+    Read from ``os.wait4`` on the child by default, or parsed from GNU
+    ``time -v`` output when that fallback is used. ``raw`` holds the parsed
+    ``time -v`` fields and is empty on the ``wait4`` path.
+    """
 
     elapsed_seconds: Optional[float] = None
     user_seconds: Optional[float] = None
@@ -31,7 +47,7 @@ class TimeUsage:
     raw: Dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class OpenMCBuildInfo:
     """Metadata extracted from ``openmc -v``."""
 
@@ -42,9 +58,10 @@ class OpenMCBuildInfo:
     def as_dict(self) -> Dict[str, str]:
         return dict(self.raw)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class OpenMCTimingStats:
-    """Selected timing metrics parsed from OpenMC stdout."""
+    """Selected timing metrics parsed once from OpenMC stdout."""
 
     total_elapsed: Optional[float] = None
     initialization: Optional[float] = None
@@ -54,7 +71,7 @@ class OpenMCTimingStats:
     raw: Dict[str, float] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class OpenMCRunResult:
     """Structured details about a finished OpenMC invocation."""
 
@@ -70,6 +87,17 @@ class OpenMCRunResult:
     timing_stats: Optional[OpenMCTimingStats] = None
     requested_mpi_procs: Optional[int] = None
     custom_metrics: Dict[str, float] = field(default_factory=dict)
+    stdout_path: Optional[Path] = None
+    stderr_path: Optional[Path] = None
+
+
+# Stderr lines kept in memory when the full stream is also written to a log
+_STDERR_TAIL_LINES = 1024
+
+
+def _uses_wait4(use_getrusage: bool = True) -> bool:
+    """Return whether runs are measured with ``os.wait4`` rather than ``time -v``."""
+    return use_getrusage and hasattr(os, "wait4")
 
 
 def _tty_write(msg: str) -> None:
@@ -85,9 +113,74 @@ def _tty_write(msg: str) -> None:
 def _run_subprocess_live(
     command: Sequence[str],
     cwd: Optional[str],
-    env: Dict[str, str],
+    env: Optional[Dict[str, str]],
 ) -> tuple[int, str, str]:
     """Run a subprocess, streaming stdout to ``/dev/tty`` while capturing all output."""
+    returncode, stdout, stderr, _, _ = _run_subprocess_streaming(
+        command, cwd=cwd, env=env, echo=True,
+    )
+    return returncode, stdout, stderr
+
+
+def _maxrss_kb(ru_maxrss: int) -> int:
+    """Convert an rusage ``ru_maxrss`` to kilobytes.
+
+    macOS reports it in bytes, Linux in kilobytes.
+    """
+    return ru_maxrss // 1024 if sys.platform == "darwin" else ru_maxrss
+
+
+def _wait_child(
+    proc: subprocess.Popen, start: float, collect_usage: bool
+) -> Optional[TimeUsage]:
+    """Wait for *proc*, returning its resource usage when *collect_usage* is set.
+
+    ``os.wait4`` reports the rusage of that one child (including descendants it
+    reaped, e.g. MPI ranks), which is what GNU ``time -v`` itself records.
+    """
+    if not collect_usage:
+        proc.wait()
+        return None
+
+    _, status, usage = os.wait4(proc.pid, 0)
+    elapsed = time.perf_counter() - start
+    proc.returncode = os.waitstatus_to_exitcode(status)
+
+    cpu = usage.ru_utime + usage.ru_stime
+    return TimeUsage(
+        elapsed_seconds=elapsed,
+        user_seconds=usage.ru_utime,
+        system_seconds=usage.ru_stime,
+        max_rss_kb=_maxrss_kb(usage.ru_maxrss),
+        cpu_percent=100.0 * cpu / elapsed if elapsed > 0 else None,
+    )
+
+
+def _run_subprocess_streaming(
+    command: Sequence[str],
+    cwd: Optional[str],
+    env: Optional[Dict[str, str]],
+    *,
+    capture: bool = True,
+    echo: bool = False,
+    stdout_log: Optional[Path] = None,
+    stderr_log: Optional[Path] = None,
+    collect_usage: bool = False,
+    stderr_tail: Optional[int] = None,
+) -> tuple[int, str, str, Dict[str, float], Optional[TimeUsage]]:
+    """Run a subprocess and scan its output for OpenMC timing lines as it runs.
+
+    Each line is matched against the timing regex while the child executes,
+    so no second pass over the output is needed afterwards. Lines are kept in
+    memory only when *capture* is set, copied to *stdout_log*/*stderr_log*
+    when given, and stdout is echoed to ``/dev/tty`` when *echo* is set.
+    Returns ``(returncode, stdout, stderr, timing_values, usage)``, where
+    *usage* is only filled when *collect_usage* is set.
+
+    *stderr_tail* bounds captured stderr to its last lines; pair it with
+    *stderr_log* so the full stream is still available.
+    """
+    start = time.perf_counter()
     proc = subprocess.Popen(
         command,
         cwd=cwd,
@@ -95,27 +188,45 @@ def _run_subprocess_live(
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
         text=True,
+        errors="replace",
     )
     stdout_lines: List[str] = []
-    stderr_lines: List[str] = []
-
-    def _drain(stream, lines: List[str]) -> None:
-        for line in stream:
-            lines.append(line)
-
-    stderr_thread = threading.Thread(target=_drain, args=(proc.stderr, stderr_lines))
+    stderr_lines: deque[str] = deque(maxlen=stderr_tail)
+    stdout_values: Dict[str, float] = {}
+    stderr_values: Dict[str, float] = {}
+
+    def _drain(stream, lines: MutableSequence[str], values: Dict[str, float], log: Optional[Path], tty: bool) -> None:
+        with ExitStack() as stack:
+            sink = stack.enter_context(log.open("w", encoding="utf-8")) if log is not None else None
+            for line in stream:
+                match = _TIMING_COMBINED.match(line)
+                if match:
+                    key = match.lastgroup
+                    try:
+                        values[key] = float(match.group(key))
+                    except ValueError:
+                        pass
+                if capture:
+                    lines.append(line)
+                if sink is not None:
+                    sink.write(line)
+                if tty:
+                    _tty_write(line)
+
+    stderr_thread = threading.Thread(
+        target=_drain, args=(proc.stderr, stderr_lines, stderr_values, stderr_log, False)
+    )
     stderr_thread.start()
-
-    for line in proc.stdout:
-        stdout_lines.append(line)
-        _tty_write(line)
-
+    _drain(proc.stdout, stdout_lines, stdout_values, stdout_log, echo)
     stderr_thread.join()
-    proc.wait()
+    usage = _wait_child(proc, start, collect_usage)
 
-    return proc.returncode, "".join(stdout_lines), "".join(stderr_lines)
+    # Same precedence as scanning stdout then stderr
+    values = {**stdout_values, **stderr_values}
+    return proc.returncode, "".join(stdout_lines), "".join(stderr_lines), values, usage
 
 
+@functools.lru_cache(maxsize=None)
 def _find_time_executable() -> str:
     def _is_gnu_time(exe: str) -> bool:
         try:
@@ -131,13 +242,84 @@ def _find_time_executable() -> str:
     raise RuntimeError("GNU time with -v support not found")
 
 
-_TIMING_REGEX: Dict[str, Pattern[str]] = {
-    "initialization": re.compile(r"^Total time for initialization\s*=\s*([0-9.eE+-]+)\s*seconds$"),
-    "transport": re.compile(r"^Time in transport only\s*=\s*([0-9.eE+-]+)\s*seconds$"),
-    "total_elapsed": re.compile(r"^Total time elapsed\s*=\s*([0-9.eE+-]+)\s*seconds$"),
-    "calc_rate_inactive": re.compile(r"^Calculation Rate \(inactive\)\s*=\s*([0-9.eE+-]+)\s*particles/second$"),
-    "calc_rate_active": re.compile(r"^Calculation Rate \(active\)\s*=\s*([0-9.eE+-]+)\s*particles/second$"),
-}
+def _prefetch_cross_sections(materials_xml: Path) -> int:
+    """Hint the kernel to read the cross-section libraries a model will load.
+
+    Nuclide, S(a,b) and element (photon) names in *materials_xml* are matched
+    against the libraries listed in ``cross_sections.xml`` and each matching
+    file is passed to ``posix_fadvise(POSIX_FADV_WILLNEED)``, so the OS starts
+    reading it into the page cache in the background. Returns the number of
+    files prefetched; unsupported platforms and unreadable inputs are skipped.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return 0
+    try:
+        materials = ET.parse(materials_xml).getroot()
+    except (OSError, ET.ParseError):
+        return 0
+
+    xs_file = materials.findtext("cross_sections") or os.environ.get("OPENMC_CROSS_SECTIONS")
+    if not xs_file:
+        return 0
+    xs_path = Path(xs_file.strip())
+    try:
+        libraries = ET.parse(xs_path).getroot()
+    except (OSError, ET.ParseError):
+        return 0
+
+    names: Set[str] = set()
+    for elem in materials.iter():
+        name = elem.get("name")
+        if not name or elem.tag not in ("nuclide", "sab"):
+            continue
+        names.add(name)
+        if elem.tag == "nuclide":
+            element = re.match(r"[A-Z][a-z]?", name)
+            if element:
+                names.add(element.group())
+
+    directory = libraries.findtext("directory")
+    base = xs_path.parent / directory.strip() if directory else xs_path.parent
+
+    count = 0
+    for library in libraries.iter("library"):
+        if names.isdisjoint(library.get("materials", "").split()):
+            continue
+        try:
+            fd = os.open(base / library.get("path", ""), os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            count += 1
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+    return count
+
+
+# Serializes XML export so concurrent runs can share a single model object
+_EXPORT_LOCK = threading.Lock()
+
+# ``openmc -v`` output keyed by (resolved executable, mtime), shared by all
+# runners in the process so each benchmark class doesn't re-probe the build
+_BUILD_INFO_CACHE: Dict[Tuple[str, int], OpenMCBuildInfo] = {}
+
+
+# One anchored alternation over whole lines; the named group that matched
+# identifies the metric. Only intra-line whitespace is allowed so a match can
+# never span lines.
+_TIMING_COMBINED: Pattern[str] = re.compile(
+    r"^[ \t]*(?:"
+    r"Total time for initialization[ \t]*=[ \t]*(?P<initialization>[0-9.eE+-]+)[ \t]*seconds"
+    r"|Time in transport only[ \t]*=[ \t]*(?P<transport>[0-9.eE+-]+)[ \t]*seconds"
+    r"|Total time elapsed[ \t]*=[ \t]*(?P<total_elapsed>[0-9.eE+-]+)[ \t]*seconds"
+    r"|Calculation Rate \(inactive\)[ \t]*=[ \t]*(?P<calc_rate_inactive>[0-9.eE+-]+)[ \t]*particles/second"
+    r"|Calculation Rate \(active\)[ \t]*=[ \t]*(?P<calc_rate_active>[0-9.eE+-]+)[ \t]*particles/second"
+    r")[ \t]*\r?$",
+    re.MULTILINE,
+)
 
 
 class OpenMCRunner:
@@ -151,9 +333,9 @@ class OpenMCRunner:
         default_mpi_runner: Optional[Sequence[str]] = ("mpirun",),
     ) -> None:
         self.openmc_exec = openmc_exec
-        self.time_executable = time_executable or _find_time_executable()
+        # Resolved on first use, since runs measured with getrusage never need it
+        self.time_executable = time_executable
         self.default_mpi_runner = tuple(default_mpi_runner) if default_mpi_runner else None
-        self._cached_build_info: Optional[OpenMCBuildInfo] = None
 
     def run_model(
         self,
@@ -170,14 +352,24 @@ class OpenMCRunner:
         time_executable: Optional[str] = None,
         capture_output: bool = True,
         live_output: bool = False,
+        log_output: bool = False,
+        cpu_list: Optional[Sequence[int]] = None,
+        prebuilt_dir: Optional[Path] = None,
+        use_inprocess: bool = False,
+        use_getrusage: bool = True,
     ) -> OpenMCRunResult:
         """
-        Export *model* to XML and execute it under ``time -v``.
+        Export *model* to XML and execute it, measuring resource usage.
+
+        Usage is read from ``os.wait4`` on the child by default; with
+        *use_getrusage* off, or where ``wait4`` is unavailable, the run is
+        wrapped in GNU ``time -v`` and its output parsed instead.
 
         Parameters
         ----------
         model:
             An ``openmc.Model`` instance or any object exposing ``export_to_xml``.
+            Ignored when *prebuilt_dir* is given.
         threads:
             Number of OpenMP threads to request. Sets both ``OMP_NUM_THREADS`` and
             ``OPENMC_THREADS`` in the child environment when provided.
@@ -200,28 +392,90 @@ class OpenMCRunner:
             Override the executable name/path for OpenMC.
         time_executable:
             Override path to GNU ``time``. Must support ``-v`` and ``-o``.
+            Only used when *use_getrusage* is off or unsupported.
         capture_output:
             When ``True`` (default), capture stdout/stderr; otherwise inherit the
             parent's streams.
         live_output:
             When ``True``, stream OpenMC's stdout to the terminal in real time
             via ``/dev/tty`` while still capturing all output for metric parsing.
-            Takes precedence over *capture_output*.
+            Takes precedence over *capture_output*. Combined with *log_output*,
+            output is also written to the logs and only the last lines of
+            stderr are captured.
+        log_output:
+            When ``True``, write stdout/stderr to ``stdout.log``/``stderr.log``
+            in the working directory instead of holding them in memory. The
+            result's ``stdout``/``stderr`` are left empty and ``stdout_path``/
+            ``stderr_path`` point at the logs, which only outlive the call when
+            the working directory is kept. The logs are written even when
+            *live_output* is set. Takes precedence over *capture_output*.
+        cpu_list:
+            CPU indices to pin the run to via ``taskset``. Used to keep
+            concurrent runs on disjoint cores.
+        prebuilt_dir:
+            Directory holding XML input already exported from the model. Its
+            files are linked into the working directory instead of exporting
+            *model* again, which avoids re-serializing the same model for
+            every run.
+        use_inprocess:
+            Run OpenMC inside this process through ``openmc.lib`` instead of
+            launching ``openmc`` as a child process. Avoids process creation,
+            which dominate very small models. Resource usage comes from
+            ``getrusage``; ``max_rss_kb`` is the peak of this whole process,
+            not of the run alone. MPI is not supported, and *openmc_exec*,
+            *time_executable*, *extra_env* and *cpu_list* are ignored.
+        use_getrusage:
+            When ``True`` (default), measure the run with ``os.wait4`` on the
+            child instead of wrapping it in ``time -v``, saving a process and a
+            file parse per run. Falls back to ``time -v`` on platforms without
+            ``wait4``.
         """
 
         run_openmc_exec = openmc_exec or self.openmc_exec
-        run_time_exec = time_executable or self.time_executable
-
-        workdir_path, cleanup = self._prepare_workdir(working_dir)
-
-        try:
-            self._export_model(model, workdir_path)
+        collect_usage = _uses_wait4(use_getrusage)
+        run_time_exec = None
+        if not collect_usage:
+            run_time_exec = time_executable or self.time_executable or _find_time_executable()
+
+        stdout_path: Optional[Path] = None
+        stderr_path: Optional[Path] = None
+
+        with ExitStack() as stack:
+            workdir_path = self._prepare_workdir(working_dir, keep_workdir, stack)
+            if prebuilt_dir is not None:
+                self._link_prebuilt(Path(prebuilt_dir), workdir_path)
+            else:
+                self._export_model(model, workdir_path)
+
+            if use_inprocess:
+                if mpi_procs is not None and mpi_procs > 1:
+                    raise ValueError("MPI is not supported for in-process runs")
+                args = self._inprocess_args(threads, openmc_args)
+                returncode, stdout, stderr, time_usage = self._run_inprocess(
+                    workdir_path, args
+                )
+                return OpenMCRunResult(
+                    returncode=returncode,
+                    stdout=stdout,
+                    stderr=stderr,
+                    command=["openmc.lib", *args],
+                    workdir=workdir_path,
+                    threads=threads,
+                    mpi_procs=None,
+                    time_usage=time_usage,
+                    timing_stats=_parse_openmc_timing(stdout, stderr),
+                    requested_mpi_procs=mpi_procs,
+                )
 
-            time_output = workdir_path / "time-usage.txt"
+            time_output = workdir_path / "time-usage.txt" if run_time_exec else None
 
             env = self._build_environment(os.environ, threads=threads, extra_env=extra_env)
+            # Build info is reported on every result; it comes from the
+            # process-wide cache, so only the MPI check is conditional
             build_info = self._get_build_info(run_openmc_exec, env)
-            effective_mpi_procs = self._select_mpi_procs(mpi_procs, build_info)
+            effective_mpi_procs = None
+            if mpi_procs is not None and mpi_procs > 1:
+                effective_mpi_procs = self._select_mpi_procs(mpi_procs, build_info)
 
             command = self._build_command(
                 run_openmc_exec,
@@ -230,32 +484,44 @@ class OpenMCRunner:
                 mpi_command=mpi_command,
                 time_exec=run_time_exec,
                 time_output=time_output,
+                cpu_list=cpu_list,
             )
 
-            if live_output:
-                returncode, stdout, stderr = _run_subprocess_live(
-                    command, cwd=str(workdir_path), env=env,
-                )
-                time_usage = self._parse_time_output(time_output)
-                timing_stats = _parse_openmc_timing(stdout, stderr)
-            else:
-                completed = subprocess.run(
+            if live_output or log_output:
+                if log_output:
+                    # Live output is teed to the logs; only a tail of stderr
+                    # is kept in memory
+                    stdout_path = workdir_path / "stdout.log"
+                    stderr_path = workdir_path / "stderr.log"
+                returncode, stdout, stderr, timing_values, usage = _run_subprocess_streaming(
                     command,
                     cwd=str(workdir_path),
-                    capture_output=capture_output,
-                    text=True,
                     env=env,
-                    check=False,
+                    capture=live_output,
+                    echo=live_output,
+                    stdout_log=stdout_path,
+                    stderr_log=stderr_path,
+                    collect_usage=collect_usage,
+                    stderr_tail=_STDERR_TAIL_LINES if stderr_path is not None else None,
                 )
-                returncode = completed.returncode
-                stdout = completed.stdout if capture_output else ""
-                stderr = completed.stderr if capture_output else ""
-                time_usage = self._parse_time_output(time_output)
-                timing_stats = (
-                    _parse_openmc_timing(stdout, stderr)
-                    if capture_output
-                    else None
+                timing_stats = _timing_stats_from_values(timing_values)
+            elif capture_output:
+                returncode, stdout, stderr, timing_values, usage = _run_subprocess_streaming(
+                    command, cwd=str(workdir_path), env=env, collect_usage=collect_usage,
                 )
+                timing_stats = _timing_stats_from_values(timing_values)
+            else:
+                start = time.perf_counter()
+                proc = subprocess.Popen(command, cwd=str(workdir_path), env=env)
+                usage = _wait_child(proc, start, collect_usage)
+                returncode = proc.returncode
+                stdout = stderr = ""
+                timing_stats = None
+
+            if time_output is not None:
+                time_usage = self._parse_time_output(time_output)
+            else:
+                time_usage = usage or TimeUsage()
 
             return OpenMCRunResult(
                 returncode=returncode,
@@ -269,17 +535,91 @@ class OpenMCRunner:
                 build_info=build_info,
                 timing_stats=timing_stats,
                 requested_mpi_procs=mpi_procs,
+                stdout_path=stdout_path,
+                stderr_path=stderr_path,
             )
+
+    @staticmethod
+    def _inprocess_args(
+        threads: Optional[int], openmc_args: Optional[Sequence[str]]
+    ) -> List[str]:
+        args: List[str] = []
+        if threads is not None:
+            args.extend(["-s", str(threads)])
+        if openmc_args:
+            args.extend(openmc_args)
+        return args
+
+    @staticmethod
+    def _run_inprocess(workdir: Path, args: Sequence[str]) -> tuple[int, str, str, TimeUsage]:
+        import ctypes
+        import resource
+
+        import openmc.lib
+        from openmc.exceptions import OpenMCError
+
+        # OpenMC writes through C stdio, so redirect the file descriptors
+        # rather than sys.stdout to capture its output for timing parsing
+        log_path = workdir / "stdout.log"
+        libc = ctypes.CDLL(None)
+        sys.stdout.flush()
+        sys.stderr.flush()
+        saved_stdout = os.dup(1)
+        saved_stderr = os.dup(2)
+        saved_cwd = os.getcwd()
+        stderr = ""
+        returncode = 0
+        try:
+            with log_path.open("wb") as log:
+                os.dup2(log.fileno(), 1)
+                os.dup2(log.fileno(), 2)
+                os.chdir(workdir)
+                before = resource.getrusage(resource.RUSAGE_SELF)
+                start = time.perf_counter()
+                try:
+                    openmc.lib.init(args=list(args))
+                    try:
+                        openmc.lib.run()
+                    finally:
+                        openmc.lib.finalize()
+                except OpenMCError as exc:
+                    returncode = 1
+                    stderr = str(exc)
+                elapsed = time.perf_counter() - start
+                after = resource.getrusage(resource.RUSAGE_SELF)
+                libc.fflush(None)
         finally:
-            if cleanup and not keep_workdir:
-                shutil.rmtree(workdir_path, ignore_errors=True)
+            os.chdir(saved_cwd)
+            os.dup2(saved_stdout, 1)
+            os.dup2(saved_stderr, 2)
+            os.close(saved_stdout)
+            os.close(saved_stderr)
+
+        user = after.ru_utime - before.ru_utime
+        system = after.ru_stime - before.ru_stime
+        time_usage = TimeUsage(
+            elapsed_seconds=elapsed,
+            user_seconds=user,
+            system_seconds=system,
+            max_rss_kb=_maxrss_kb(after.ru_maxrss),
+            cpu_percent=100.0 * (user + system) / elapsed if elapsed > 0 else None,
+        )
+        stdout = log_path.read_text(encoding="utf-8", errors="replace")
+        return returncode, stdout, stderr, time_usage
 
     @staticmethod
-    def _prepare_workdir(working_dir: Optional[Path]) -> tuple[Path, bool]:
+    def _prepare_workdir(
+        working_dir: Optional[Path], keep_workdir: bool, stack: ExitStack
+    ) -> Path:
         if working_dir is not None:
-            return Path(working_dir), False
-        temp_path = Path(tempfile.mkdtemp(prefix="openmc-bench-"))
-        return temp_path, True
+            return Path(working_dir)
+        if keep_workdir:
+            return Path(tempfile.mkdtemp(prefix="openmc-bench-"))
+        # Removed when *stack* unwinds, including on errors
+        temp_dir = tempfile.TemporaryDirectory(
+            prefix="openmc-bench-", ignore_cleanup_errors=True
+        )
+        return Path(stack.enter_context(temp_dir))
 
     @staticmethod
     def _export_model(model: object, destination: Path) -> None:
@@ -288,13 +628,27 @@ class OpenMCRunner:
         exporter = getattr(model, "export_to_xml", None)
         if exporter is None or not callable(exporter):
             raise TypeError("model must provide an export_to_xml() method")
-        exporter(str(destination))
+        with _EXPORT_LOCK:
+            exporter(str(destination))
+
+    @staticmethod
+    def _link_prebuilt(source: Path, destination: Path) -> None:
+        # Hard links keep each working directory self-contained even after
+        # the source directory is removed; fall back to copying across
+        # filesystems
+        for path in source.iterdir():
+            if not path.is_file():
+                continue
+            target = destination / path.name
+            try:
+                os.link(path, target)
+            except OSError:
+                shutil.copy2(path, target)
 
     def _select_mpi_procs(
-        self, requested: Optional[int], build_info: Optional[OpenMCBuildInfo]
+        self, requested: int, build_info: Optional[OpenMCBuildInfo]
     ) -> Optional[int]:
-        if not requested or requested <= 1:
-            return None
+        # The caller only asks for more than one rank
         if not self._build_supports_mpi(build_info):
             return None
         return requested
@@ -315,19 +669,17 @@ class OpenMCRunner:
         openmc_args: Optional[Sequence[str]],
         mpi_procs: Optional[int],
         mpi_command: Optional[Sequence[str]],
-        time_exec: str,
-        time_output: Path,
+        time_exec: Optional[str],
+        time_output: Optional[Path],
+        cpu_list: Optional[Sequence[int]] = None,
     ) -> Sequence[str]:
-        base_cmd: list[str] = []
         launcher = self._resolve_mpi_launcher(mpi_procs, mpi_command)
-        if launcher:
-            base_cmd.extend(launcher)
-        base_cmd.append(openmc_exec)
-        if openmc_args:
-            base_cmd.extend(openmc_args)
-
-        full_cmd = [time_exec, "-v", "-o", str(time_output), *base_cmd]
-        return full_cmd
+        prefix: tuple[str, ...] = ()
+        if cpu_list:
+            prefix = ("taskset", "-c", ",".join(map(str, cpu_list)))
+        if time_exec is not None:
+            prefix = (*prefix, time_exec, "-v", "-o", str(time_output))
+        return (*prefix, *launcher, openmc_exec, *(openmc_args or ()))
 
     def _resolve_mpi_launcher(
         self,
@@ -355,7 +707,10 @@ class OpenMCRunner:
         *,
         threads: Optional[int],
         extra_env: Optional[Mapping[str, str]],
-    ) -> Dict[str, str]:
+    ) -> Optional[Dict[str, str]]:
+        """Return the child environment, or ``None`` to inherit the parent's."""
+        if threads is None and not extra_env:
+            return None
         env: Dict[str, str] = dict(parent_env)
         if threads is not None:
             env["OMP_NUM_THREADS"] = str(threads)
@@ -365,25 +720,26 @@ class OpenMCRunner:
         return env
 
     def _get_build_info(
-        self, openmc_exec: str, env: Mapping[str, str]
+        self, openmc_exec: str, env: Optional[Mapping[str, str]]
     ) -> Optional[OpenMCBuildInfo]:
-        if self._cached_build_info and openmc_exec == self.openmc_exec:
-            return self._cached_build_info
+        key = _build_info_key(openmc_exec)
+        if key is not None and key in _BUILD_INFO_CACHE:
+            return _BUILD_INFO_CACHE[key]
 
         info = self._fetch_build_info(openmc_exec, env)
-        if openmc_exec == self.openmc_exec:
-            self._cached_build_info = info
+        if info is not None and key is not None:
+            _BUILD_INFO_CACHE[key] = info
         return info
 
     def _fetch_build_info(
-        self, openmc_exec: str, env: Mapping[str, str]
+        self, openmc_exec: str, env: Optional[Mapping[str, str]]
     ) -> Optional[OpenMCBuildInfo]:
         try:
             completed = subprocess.run(
                 [openmc_exec, '-v'],
                 capture_output=True,
                 text=True,
-                env=dict(env),
+                env=dict(env) if env is not None else None,
                 check=True,
             )
         except (OSError, subprocess.CalledProcessError):
@@ -406,46 +762,71 @@ class OpenMCRunner:
             return TimeUsage()
 
         raw: Dict[str, str] = {}
-        with time_output.open("r", encoding="utf-8") as handle:
-            for line in handle:
-                if ': ' not in line:
-                    continue
-                key, value = line.split(': ', 1)
+        for line in time_output.read_text(encoding="utf-8").splitlines():
+            key, sep, value = line.partition(': ')
+            if sep:
                 raw[key.strip()] = value.strip()
 
-        return TimeUsage(
-            elapsed_seconds=_parse_elapsed(_lookup_stat(raw, "Elapsed (wall clock) time")),
-            user_seconds=_parse_float(_lookup_stat(raw, "User time (seconds)")),
-            system_seconds=_parse_float(_lookup_stat(raw, "System time (seconds)")),
-            max_rss_kb=_parse_int(_lookup_stat(raw, "Maximum resident set size")),
-            cpu_percent=_parse_percent(_lookup_stat(raw, "Percent of CPU this job got")),
-            raw=raw,
+        usage = TimeUsage(
+            elapsed_seconds=_parse_elapsed(_lookup_stat(raw, "elapsed")),
+            user_seconds=_parse_float(_lookup_stat(raw, "user")),
+            system_seconds=_parse_float(_lookup_stat(raw, "system")),
+            max_rss_kb=_parse_int(_lookup_stat(raw, "max_rss")),
+            cpu_percent=_parse_percent(_lookup_stat(raw, "cpu_percent")),
         )
+        # Keep only the fields that were parsed, not all ~20 time -v lines
+        for label, _ in _TIME_V_KEYS.values():
+            if label in raw:
+                usage.raw[label] = raw[label]
+        return usage
+
+
+# Exact GNU ``time -v`` labels, with the prefix used to match variants
+_TIME_V_KEYS: Dict[str, Tuple[str, str]] = {
+    "elapsed": ("Elapsed (wall clock) time (h:mm:ss or m:ss)", "Elapsed (wall clock) time"),
+    "user": ("User time (seconds)", "User time (seconds)"),
+    "system": ("System time (seconds)", "System time (seconds)"),
+    "max_rss": ("Maximum resident set size (kbytes)", "Maximum resident set size"),
+    "cpu_percent": ("Percent of CPU this job got", "Percent of CPU this job got"),
+}
 
 
-def _lookup_stat(values: Mapping[str, str], key_prefix: str) -> Optional[str]:
-    for key, value in values.items():
-        if key.startswith(key_prefix):
-            return value
+def _build_info_key(openmc_exec: str) -> Optional[Tuple[str, int]]:
+    path = shutil.which(openmc_exec)
+    if path is None:
+        return None
+    try:
+        return path, os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _lookup_stat(values: Dict[str, str], stat: str) -> Optional[str]:
+    key, prefix = _TIME_V_KEYS[stat]
+    value = values.get(key)
+    if value is not None:
+        return value
+    for name, candidate in values.items():
+        if name.startswith(prefix):
+            # Memoize under the exact label so later lookups hit directly
+            values[key] = candidate
+            return candidate
     return None
 
 
 def _parse_openmc_timing(*streams: str) -> Optional[OpenMCTimingStats]:
     values: Dict[str, float] = {}
-    for stream in streams:
-        if not stream:
+    text = "\n".join(stream for stream in streams if stream)
+    for match in _TIMING_COMBINED.finditer(text):
+        key = match.lastgroup
+        try:
+            values[key] = float(match.group(key))
+        except ValueError:
             continue
-        for line in stream.splitlines():
-            stripped = line.strip()
-            if not stripped:
-                continue
-            for key, pattern in _TIMING_REGEX.items():
-                match = pattern.match(stripped)
-                if match:
-                    try:
-                        values[key] = float(match.group(1))
-                    except ValueError:
-                        continue
+    return _timing_stats_from_values(values)
+
+
+def _timing_stats_from_values(values: Dict[str, float]) -> Optional[OpenMCTimingStats]:
     if not values:
         return None
 
@@ -466,10 +847,10 @@ def _parse_openmc_version_output(lines: Sequence[str]) -> Dict[str, str]:
         if not stripped:
             continue
         if stripped.startswith('OpenMC version'):
-            info['OpenMC version'] = stripped.partition('OpenMC version')[2].strip()
+            info['OpenMC version'] = stripped[len('OpenMC version'):].strip()
             continue
-        if ':' in stripped:
-            key, value = stripped.split(':', 1)
+        key, sep, value = stripped.partition(':')
+        if sep:
             info[key.strip()] = value.strip()
     return info
 
@@ -515,6 +896,75 @@ def _parse_elapsed(value: Optional[str]) -> Optional[float]:
     return None
 
 
+def _available_cpus() -> Optional[List[int]]:
+    """Return the CPUs this process may run on, or ``None`` if unsupported."""
+    try:
+        return sorted(os.sched_getaffinity(0))
+    except AttributeError:
+        return None
+
+
+class _CpuPool:
+    """Hands out disjoint sets of CPUs to concurrently running jobs."""
+
+    def __init__(self, cpus: Sequence[int]) -> None:
+        self._free: List[int] = sorted(cpus)
+        self._size = len(self._free)
+        self._released = threading.Condition()
+
+    @contextmanager
+    def reserve(self, demand: int) -> Iterator[List[int]]:
+        """Block until *demand* CPUs are free and hold them for the block.
+
+        Demands larger than the pool are capped at the pool size, so such a
+        job simply waits until it can have every CPU.
+        """
+        demand = min(max(demand, 1), self._size)
+        with self._released:
+            self._released.wait_for(lambda: len(self._free) >= demand)
+            cpus = self._free[:demand]
+            del self._free[:demand]
+        try:
+            yield cpus
+        finally:
+            with self._released:
+                self._free.extend(cpus)
+                self._free.sort()
+                self._released.notify_all()
+
+
+def run_models_concurrent(
+    runner: OpenMCRunner,
+    specs: Sequence[Mapping[str, object]],
+    *,
+    max_workers: Optional[int] = None,
+) -> List[OpenMCRunResult]:
+    """Run several models at once, each pinned to its own CPUs.
+
+    Each spec holds keyword arguments for :meth:`OpenMCRunner.run_model`,
+    including ``model``. A run needs ``threads * mpi_procs`` CPUs; it waits
+    until that many are free and is pinned to them via ``cpu_list``, so
+    concurrent runs never share cores. Specs that set ``cpu_list`` are run as
+    given, and nothing is pinned where CPU affinity or ``taskset`` is
+    unavailable. Results are returned in the order of *specs*.
+    """
+    cpus = _available_cpus()
+    pool = _CpuPool(cpus) if cpus and shutil.which("taskset") else None
+
+    def _run(spec: Mapping[str, object]) -> OpenMCRunResult:
+        kwargs = dict(spec)
+        if pool is None or kwargs.get("cpu_list") is not None:
+            return runner.run_model(**kwargs)
+
+        demand = (kwargs.get("threads") or 1) * (kwargs.get("mpi_procs") or 1)
+        with pool.reserve(demand) as cpu_list:
+            kwargs["cpu_list"] = cpu_list
+            return runner.run_model(**kwargs)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_run, specs))
+
+
 def run_model_with_time(
     model: object,
     *,
@@ -2,24 +2,291 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+import functools
+import hashlib
+import inspect
 import linecache
+import math
+import operator
 import os
+from pathlib import Path
+import pickle
+import shutil
 import sys
+import tempfile
+import threading
 from types import FunctionType, ModuleType
-from typing import Callable, Dict, Optional, Tuple, Type
+from typing import TYPE_CHECKING, Callable, Dict, Optional, Sequence, Tuple, Type
+
+from ..openmc_runner import (
+    OpenMCRunResult,
+    OpenMCRunner,
+    _CpuPool,
+    _available_cpus,
+    _find_time_executable,
+    _prefetch_cross_sections,
+    _run_subprocess_live,
+    _tty_write,
+    _uses_wait4,
+)
+from ..config import _CONFIGS, _MPI_RUNNER, _param_key, _nan
 
-import openmc
+if TYPE_CHECKING:
+    import openmc
 
-from ..openmc_runner import OpenMCRunResult, OpenMCRunner, _tty_write, _run_subprocess_live
-from ..config import _CONFIGS, _MPI_RUNNER, _param_key, _nan
+
+@dataclass(frozen=True, slots=True)
+class _RunMetrics:
+    """Scalar metrics extracted from one run, with missing values as NaN.
+
+    ``setup_cache`` returns one of these per configuration instead of the full
+    :class:`OpenMCRunResult`, so asv pickles only a handful of floats and every
+    ``track_*`` method is a dict lookup plus a slot read.
+    """
+
+    elapsed_wall: float
+    max_rss_kb: float
+    total_time_elapsed: float
+    initialization_time: float
+    transport_time: float
+    calc_rate_inactive: float
+    calc_rate_active: float
+    custom: Dict[str, float]
+
+    @classmethod
+    def from_result(cls, result: OpenMCRunResult) -> "_RunMetrics":
+        usage = result.time_usage
+        stats = result.timing_stats
+        rss = usage.max_rss_kb
+        return cls(
+            elapsed_wall=_nan(usage.elapsed_seconds),
+            max_rss_kb=float(rss) if rss is not None else _nan(None),
+            total_time_elapsed=_nan(stats.total_elapsed if stats else None),
+            initialization_time=_nan(stats.initialization if stats else None),
+            transport_time=_nan(stats.transport if stats else None),
+            calc_rate_inactive=_nan(stats.calc_rate_inactive if stats else None),
+            calc_rate_active=_nan(stats.calc_rate_active if stats else None),
+            custom={name: _nan(value) for name, value in result.custom_metrics.items()},
+        )
+
+    @classmethod
+    def skipped(cls) -> "_RunMetrics":
+        """Metrics for a configuration that was not run; every value is NaN."""
+        nan = _nan(None)
+        return cls(nan, nan, nan, nan, nan, nan, nan, {})
+
+
+_MetricsTable = Dict[Tuple[int, Optional[int]], _RunMetrics]
+
+# Results of model benchmarks already run in this process, keyed by
+# (benchmark class, hash of the exported model XML)
+_RESULT_CACHE: Dict[Tuple[str, str], _MetricsTable] = {}
+
+# Amount of OpenMC's stderr quoted in the error raised for a failed run
+_ERROR_TAIL_BYTES = 4096
+
+
+# Models built in this process, keyed by builder so that every benchmark
+# class created from the same builder shares one model
+_MODEL_CACHE: Dict[Callable[[], openmc.Model], openmc.Model] = {}
+
+
+def _memoize_builder(model_builder: Callable[[], openmc.Model]) -> Callable[[], openmc.Model]:
+    @functools.wraps(model_builder)
+    def build_model() -> openmc.Model:
+        model = _MODEL_CACHE.get(model_builder)
+        if model is None:
+            model = _MODEL_CACHE[model_builder] = model_builder()
+        return model
+
+    return build_model
+
+
+# One runner serves every benchmark instance in this process; it carries no
+# per-run state and is already shared across threads by parallel setup
+_RUNNER: Optional[OpenMCRunner] = None
+_RUNNER_LOCK = threading.Lock()
+
+
+def _shared_runner() -> OpenMCRunner:
+    global _RUNNER
+    with _RUNNER_LOCK:
+        if _RUNNER is None:
+            _RUNNER = OpenMCRunner(default_mpi_runner=_MPI_RUNNER)
+        return _RUNNER
+
+
+# Results persisted across asv invocations when OPENMC_BENCH_RESULT_CACHE=1
+_DISK_RESULT_CACHE = Path.home() / ".cache" / "openmc-bench" / "results"
+_PICKLE_PROTOCOL = 5
+
+
+def _metric_source(func: Callable) -> str:
+    """Return the source of a custom metric, or its qualified name if unavailable."""
+    try:
+        return inspect.getsource(func)
+    except (OSError, TypeError):
+        return f"{getattr(func, '__module__', '')}.{getattr(func, '__qualname__', repr(func))}"
+
+
+def _disk_result_key(
+    runner: OpenMCRunner,
+    class_name: str,
+    model_hash: str,
+    custom_metrics: Dict[str, Callable],
+) -> Optional[str]:
+    """Return the on-disk results key, or ``None`` if the build can't be identified.
+
+    Results are only reusable for the same benchmark class, model XML, custom
+    metric definitions, measurement method, OpenMC commit and cross-section
+    library, so all of them go into the key.
+    """
+    build_info = runner._get_build_info(runner.openmc_exec, None)
+    if build_info is None or not build_info.commit_hash:
+        return None
+    xs_path = os.environ.get("OPENMC_CROSS_SECTIONS", "")
+    try:
+        xs_mtime = os.stat(xs_path).st_mtime_ns if xs_path else 0
+    except OSError:
+        xs_mtime = 0
+    digest = hashlib.blake2b(digest_size=16)
+    metrics = [
+        part
+        for name in sorted(custom_metrics)
+        for part in (name, _metric_source(custom_metrics[name]))
+    ]
+    measurement = "wait4" if _uses_wait4() else "time -v"
+    for part in (
+        class_name, model_hash, *metrics, measurement,
+        build_info.commit_hash, xs_path, str(xs_mtime),
+    ):
+        digest.update(part.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _disk_result_path(key: str, threads: int, mpi_procs: Optional[int]) -> Path:
+    return _DISK_RESULT_CACHE / f"{key}_{threads}_{mpi_procs or 0}.pkl"
+
+
+def _load_disk_results(
+    key: str, configs: Sequence[Tuple[int, Optional[int]]]
+) -> _MetricsTable:
+    cache: _MetricsTable = {}
+    for threads, mpi_procs in configs:
+        try:
+            with _disk_result_path(key, threads, mpi_procs).open("rb") as fh:
+                cache[(threads, mpi_procs)] = pickle.load(fh)
+        except (OSError, EOFError, AttributeError, pickle.UnpicklingError):
+            continue
+    return cache
+
+
+def _store_disk_results(key: str, results: _MetricsTable) -> None:
+    """Persist *results*; failures only cost a rerun, so they are not raised."""
+    try:
+        _DISK_RESULT_CACHE.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return
+    for (threads, mpi_procs), metrics in results.items():
+        # Write then rename so concurrent asv processes never read a
+        # partial file
+        tmp_name = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                "wb", dir=_DISK_RESULT_CACHE, delete=False
+            ) as fh:
+                tmp_name = fh.name
+                # Pinned so that interpreters with different default
+                # protocols write the same files
+                pickle.dump(metrics, fh, protocol=_PICKLE_PROTOCOL)
+            os.replace(tmp_name, _disk_result_path(key, threads, mpi_procs))
+            tmp_name = None
+        except Exception as exc:
+            _tty_write(f"  Could not cache results for ({threads}, {mpi_procs}): {exc}\n")
+        finally:
+            if tmp_name is not None:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
+
+
+def _config_cpus(config: Tuple[int, Optional[int]]) -> int:
+    """Return the number of CPUs a ``(threads, mpi_procs)`` configuration uses."""
+    threads, mpi_procs = config
+    return threads * (mpi_procs or 1)
+
+
+def _oversubscribed(
+    configs: Sequence[Tuple[int, Optional[int]]],
+) -> list[Tuple[int, Optional[int]]]:
+    """Return the configurations needing more CPUs than this host should run.
+
+    The limit is the number of usable CPUs times ``OPENMC_BENCH_OVERSUB``
+    (default 1.25). Oversubscribed runs are slow and their timings are noise.
+    """
+    raw = os.environ.get("OPENMC_BENCH_OVERSUB", "1.25")
+    try:
+        factor = float(raw)
+    except ValueError:
+        factor = math.nan
+    if not math.isfinite(factor) or factor <= 0:
+        raise ValueError(f"OPENMC_BENCH_OVERSUB must be a finite number above 0, got {raw!r}")
+    cpus = _available_cpus()
+    limit = (len(cpus) if cpus else os.cpu_count() or 1) * factor
+    return [config for config in configs if _config_cpus(config) > limit]
+
+
+def _read_tail(path: Path, nbytes: int) -> str:
+    """Return at most the last *nbytes* of *path* as text."""
+    with path.open("rb") as fh:
+        fh.seek(0, os.SEEK_END)
+        fh.seek(max(fh.tell() - nbytes, 0))
+        return fh.read().decode("utf-8", errors="replace")
+
+
+def _hash_model_dir(model_dir: Path) -> str:
+    """Return a SHA-256 digest over the names and contents of exported model files."""
+    digest = hashlib.sha256()
+    for path in sorted(model_dir.iterdir()):
+        if path.is_file():
+            digest.update(path.name.encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _config_keys(
+    configs: Sequence[Tuple[int, Optional[int]]],
+) -> Dict[Tuple[int, Optional[int]], Tuple[int, Optional[int]]]:
+    """Map each configuration in ``params`` to its normalized result key."""
+    return {config: _param_key(*config) for config in configs}
+
+
+def _make_track(attribute: str, unit: str, owner: str) -> Callable:
+    """Create a ``track_<attribute>`` method reading one field of the cached metrics."""
+    get = operator.attrgetter(attribute)
+
+    def track(self, results: _MetricsTable, config: Tuple[int, Optional[int]]) -> float:
+        # ``_keys`` maps each entry of ``params`` to its normalized key; the
+        # fallback only runs if asv hands the parameter back in another form
+        metrics = results[self._keys.get(config) or _param_key(*config)]
+        return get(metrics)
+
+    track.__name__ = f"track_{attribute}"
+    track.__qualname__ = f"{owner}.track_{attribute}"
+    track.unit = unit
+    return track
 
 
 def _make_custom_track(metric_name: str) -> Callable:
     """Create a ``track_*`` method that reads a pre-computed custom metric."""
 
     def track(self, results, config):
-        result = results[_param_key(*config)]
-        return _nan(result.custom_metrics.get(metric_name))
+        metrics = results[self._keys.get(config) or _param_key(*config)]
+        return metrics.custom.get(metric_name, _nan(None))
 
     track.__name__ = f"track_{metric_name}"
     track.__qualname__ = f"_BaseBenchmark.track_{metric_name}"
@@ -34,6 +301,7 @@ class _BaseBenchmark:
     timeout = 600
 
     configs: Tuple[Tuple[int, Optional[int]], ...] = _CONFIGS
+    _keys: Dict[Tuple[int, Optional[int]], Tuple[int, Optional[int]]] = _config_keys(_CONFIGS)
 
     _custom_metrics: Dict[str, Callable] = {}
 
@@ -41,24 +309,18 @@ class _BaseBenchmark:
         for name, func in self._custom_metrics.items():
             result.custom_metrics[name] = func(result)
 
-    def track_elapsed_wall(
-        self,
-        results: Dict[Tuple[int, Optional[int]], OpenMCRunResult],
-        config: Tuple[int, Optional[int]],
-    ) -> float:
-        result = results[_param_key(*config)]
-        return _nan(result.time_usage.elapsed_seconds)
-    track_elapsed_wall.unit = "seconds"
-
-    def track_max_rss_kb(
-        self,
-        results: Dict[Tuple[int, Optional[int]], OpenMCRunResult],
-        config: Tuple[int, Optional[int]],
-    ) -> float:
-        result = results[_param_key(*config)]
-        rss = result.time_usage.max_rss_kb
-        return float(rss) if rss is not None else _nan(None)
-    track_max_rss_kb.unit = "KB"
+    def _check_cache_complete(self, cache: _MetricsTable) -> None:
+        """Ensure every configuration has a result so ``track_*`` never runs OpenMC."""
+        missing = [
+            config for config, key in self._keys.items() if key not in cache
+        ]
+        if missing:
+            raise RuntimeError(
+                f"setup_cache did not produce results for configurations: {missing}"
+            )
+
+    track_elapsed_wall = _make_track("elapsed_wall", "seconds", "_BaseBenchmark")
+    track_max_rss_kb = _make_track("max_rss_kb", "KB", "_BaseBenchmark")
 
 
 class _OpenMCModelBenchmark(_BaseBenchmark):
@@ -67,77 +329,139 @@ class _OpenMCModelBenchmark(_BaseBenchmark):
     def __init__(self) -> None:
         self._runner: Optional[OpenMCRunner] = None
         self._model = None
-        self._cache: Optional[Dict[Tuple[int, Optional[int]], OpenMCRunResult]] = None
 
-    def setup_cache(self, *_params: object) -> Dict[Tuple[int, Optional[int]], OpenMCRunResult]:
+    def setup_cache(self, *_params: object) -> _MetricsTable:
         _tty_write(f"\n{'=' * 60}\n")
         _tty_write(f"  Benchmark: {type(self).__name__}\n")
         _tty_write(f"{'=' * 60}\n")
-        if self._cache is None:
-            runner = self._ensure_runner()
-            model = self._ensure_model()
-            cache: Dict[Tuple[int, Optional[int]], OpenMCRunResult] = {}
-            for threads, mpi_procs in self.configs:
-                _tty_write(f"  Running: threads={threads}, mpi_procs={mpi_procs}\n")
-                result = self._run_model(runner, model, threads, mpi_procs)
-                self._compute_custom_metrics(result)
-                cache[(threads, mpi_procs)] = result
-            self._cache = cache
-        return self._cache
-
-    def track_total_time_elapsed(
-        self,
-        results: Dict[Tuple[int, Optional[int]], OpenMCRunResult],
-        config: Tuple[int, Optional[int]],
-    ) -> float:
-        result = results[_param_key(*config)]
-        stats = result.timing_stats
-        return _nan(stats.total_elapsed if stats else None)
-    track_total_time_elapsed.unit = "seconds"
-
-    def track_initialization_time(
-        self,
-        results: Dict[Tuple[int, Optional[int]], OpenMCRunResult],
-        config: Tuple[int, Optional[int]],
-    ) -> float:
-        result = results[_param_key(*config)]
-        stats = result.timing_stats
-        return _nan(stats.initialization if stats else None)
-    track_initialization_time.unit = "seconds"
+        runner = self._ensure_runner()
+        model = self._ensure_model()
+        # Export the model once and share the XML across all runs
+        model_dir = Path(tempfile.mkdtemp(prefix="openmc-bench-model-"))
+        try:
+            OpenMCRunner._export_model(model, model_dir)
+            cache_key = (type(self).__qualname__, _hash_model_dir(model_dir))
+            cache = _RESULT_CACHE.get(cache_key)
+            if cache is None:
+                configs = list(self._keys.values())
+                disk_key = None
+                if os.environ.get("OPENMC_BENCH_RESULT_CACHE") == "1":
+                    disk_key = _disk_result_key(runner, *cache_key, self._custom_metrics)
+                cache = _load_disk_results(disk_key, configs) if disk_key else {}
+                missing = [config for config in configs if config not in cache]
+                oversubscribed = _oversubscribed(missing)
+                if oversubscribed:
+                    _tty_write(f"  Skipping oversubscribed configurations: {oversubscribed}\n")
+                    cache.update(dict.fromkeys(oversubscribed, _RunMetrics.skipped()))
+                    missing = [config for config in missing if config not in cache]
+                if missing:
+                    # Warm the page cache so the first run doesn't pay for cold
+                    # cross-section reads that later runs don't
+                    _prefetch_cross_sections(model_dir / "materials.xml")
+                    fresh = self._run_all_configs(runner, model_dir, missing)
+                    if disk_key:
+                        _store_disk_results(disk_key, fresh)
+                    cache.update(fresh)
+                self._check_cache_complete(cache)
+                _RESULT_CACHE[cache_key] = cache
+        finally:
+            shutil.rmtree(model_dir, ignore_errors=True)
+        return cache
 
-    def track_transport_time(
-        self,
-        results: Dict[Tuple[int, Optional[int]], OpenMCRunResult],
-        config: Tuple[int, Optional[int]],
-    ) -> float:
-        result = results[_param_key(*config)]
-        stats = result.timing_stats
-        return _nan(stats.transport if stats else None)
-    track_transport_time.unit = "seconds"
+    track_total_time_elapsed = _make_track(
+        "total_time_elapsed", "seconds", "_OpenMCModelBenchmark"
+    )
+    track_initialization_time = _make_track(
+        "initialization_time", "seconds", "_OpenMCModelBenchmark"
+    )
+    track_transport_time = _make_track("transport_time", "seconds", "_OpenMCModelBenchmark")
+    track_calc_rate_inactive = _make_track(
+        "calc_rate_inactive", "particles / second", "_OpenMCModelBenchmark"
+    )
+    track_calc_rate_active = _make_track(
+        "calc_rate_active", "particles / second", "_OpenMCModelBenchmark"
+    )
 
-    def track_calc_rate_inactive(
+    def _run_all_configs(
         self,
-        results: Dict[Tuple[int, Optional[int]], OpenMCRunResult],
-        config: Tuple[int, Optional[int]],
-    ) -> float:
-        result = results[_param_key(*config)]
-        stats = result.timing_stats
-        return _nan(stats.calc_rate_inactive if stats else None)
-    track_calc_rate_inactive.unit = "particles / second"
-
-    def track_calc_rate_active(
+        runner: OpenMCRunner,
+        model_dir: Path,
+        configs: Sequence[Tuple[int, Optional[int]]],
+    ) -> _MetricsTable:
+        """Run the given configurations, concurrently when opted in.
+
+        With ``OPENMC_BENCH_PARALLEL_SETUP=1``, configurations are launched
+        from a thread pool, largest ``threads * mpi_procs`` first. Each waits
+        until that many CPUs are free and is pinned to them, so concurrent
+        runs never share cores and small configurations fill in around the
+        large ones. Pinning needs ``taskset``; without it (or CPU affinity
+        support) the configurations run sequentially. The first failure stops
+        configurations that haven't started yet.
+        """
+        cpus = None
+        if os.environ.get("OPENMC_BENCH_PARALLEL_SETUP") == "1":
+            cpus = _available_cpus()
+            if cpus and shutil.which("taskset") is None:
+                _tty_write("  taskset not found; running configurations sequentially\n")
+                cpus = None
+
+        cache: _MetricsTable = {}
+        if not cpus:
+            # Cheapest first, so a broken model fails before the long runs
+            for threads, mpi_procs in sorted(configs, key=_config_cpus):
+                _tty_write(f"  Running: threads={threads}, mpi_procs={mpi_procs}\n")
+                cache[(threads, mpi_procs)] = self._run_config(
+                    runner, model_dir, threads, mpi_procs
+                )
+            return cache
+
+        cpu_pool = _CpuPool(cpus)
+        failed = threading.Event()
+
+        def _run_pinned(threads: int, mpi_procs: Optional[int]) -> Optional[_RunMetrics]:
+            with cpu_pool.reserve(_config_cpus((threads, mpi_procs))) as cpu_list:
+                if failed.is_set():
+                    return None
+                _tty_write(
+                    f"  Running: threads={threads}, mpi_procs={mpi_procs}, "
+                    f"cpus={','.join(map(str, cpu_list))}\n"
+                )
+                try:
+                    return self._run_config(runner, model_dir, threads, mpi_procs, cpu_list)
+                except BaseException:
+                    # Set before the CPUs are released so no queued run starts
+                    failed.set()
+                    raise
+
+        # Longest job first, so the biggest run isn't left until the end
+        ordered = sorted(configs, key=_config_cpus, reverse=True)
+        with ThreadPoolExecutor(max_workers=len(ordered)) as pool:
+            futures = {pool.submit(_run_pinned, *config): config for config in ordered}
+            try:
+                for future in as_completed(futures):
+                    cache[futures[future]] = future.result()
+            except BaseException:
+                # Runs already in progress finish; queued ones return at once
+                for future in futures:
+                    future.cancel()
+                raise
+        return cache
+
+    def _run_config(
         self,
-        results: Dict[Tuple[int, Optional[int]], OpenMCRunResult],
-        config: Tuple[int, Optional[int]],
-    ) -> float:
-        result = results[_param_key(*config)]
-        stats = result.timing_stats
-        return _nan(stats.calc_rate_active if stats else None)
-    track_calc_rate_active.unit = "particles / second"
+        runner: OpenMCRunner,
+        model_dir: Path,
+        threads: int,
+        mpi_procs: Optional[int],
+        cpu_list: Optional[Sequence[int]] = None,
+    ) -> _RunMetrics:
+        result = self._run_model(runner, model_dir, threads, mpi_procs, cpu_list)
+        self._compute_custom_metrics(result)
+        return _RunMetrics.from_result(result)
 
     def _ensure_runner(self) -> OpenMCRunner:
         if self._runner is None:
-            self._runner = OpenMCRunner(default_mpi_runner=_MPI_RUNNER)
+            self._runner = _shared_runner()
         return self._runner
 
     def _ensure_model(self):
@@ -148,21 +472,29 @@ class _OpenMCModelBenchmark(_BaseBenchmark):
     def _run_model(
         self,
         runner: OpenMCRunner,
-        model,
+        model_dir: Path,
         threads: int,
         mpi_procs: Optional[int],
+        cpu_list: Optional[Sequence[int]] = None,
     ) -> OpenMCRunResult:
         result = runner.run_model(
-            model,
+            None,
+            prebuilt_dir=model_dir,
             threads=threads,
             mpi_procs=mpi_procs,
             keep_workdir=True,
             live_output=bool(os.environ.get("ASV_LIVE_OUTPUT")),
+            log_output=True,
+            cpu_list=cpu_list,
         )
         if result.returncode != 0:
-            raise RuntimeError(
-                f"OpenMC exited with {result.returncode}: {result.stderr.strip()}"
-            )
+            message = f"OpenMC exited with {result.returncode}"
+            if result.stderr_path is not None:
+                message += f" (full stderr in {result.stderr_path})"
+                stderr = _read_tail(result.stderr_path, _ERROR_TAIL_BYTES)
+            else:
+                stderr = result.stderr[-_ERROR_TAIL_BYTES:]
+            raise RuntimeError(f"{message}: {stderr.strip()}")
         return result
 
     def _build_model(self):  # pragma: no cover - abstract hook
@@ -216,7 +548,8 @@ def make_benchmark(
         "__doc__": f"Benchmark for {name} model.",
         "configs": config_options,
         "params": (config_options,),
-        "_build_model": staticmethod(model_builder),
+        "_keys": _config_keys(config_options),
+        "_build_model": staticmethod(_memoize_builder(model_builder)),
         "_custom_metrics": custom_metrics or {},
     }
     for metric_name in (custom_metrics or {}):
@@ -240,30 +573,32 @@ class _PythonBenchmark(_BaseBenchmark):
     param_names = ("(threads, mpi_procs)",)
 
     configs: Tuple[Tuple[int, Optional[int]], ...] = _PYTHON_DEFAULT_CONFIGS
+    _keys = _config_keys(_PYTHON_DEFAULT_CONFIGS)
 
     _module_path: str = ""  # fully qualified module name, set by factory
     _return_metrics: Tuple[str, ...] = ()
 
-    def __init__(self) -> None:
-        self._cache: Optional[Dict[Tuple[int, Optional[int]], OpenMCRunResult]] = None
-
-    def setup_cache(self, *_params: object) -> Dict[Tuple[int, Optional[int]], OpenMCRunResult]:
+    def setup_cache(self, *_params: object) -> _MetricsTable:
         _tty_write(f"\n{'=' * 60}\n")
         _tty_write(f"  Benchmark: {type(self).__name__}\n")
         _tty_write(f"{'=' * 60}\n")
-        if self._cache is None:
-            cache: Dict[Tuple[int, Optional[int]], OpenMCRunResult] = {}
-            for threads, mpi_procs in self.configs:
-                _tty_write(f"  Running: threads={threads}, mpi_procs={mpi_procs}\n")
-                cache[(threads, mpi_procs)] = self._run_script(threads, mpi_procs)
-            self._cache = cache
-        return self._cache
+        return self._built_cache
+
+    @functools.cached_property
+    def _built_cache(self) -> _MetricsTable:
+        """Run every configuration once; later accesses read the stored table."""
+        cache: _MetricsTable = {}
+        for (threads, mpi_procs), key in self._keys.items():
+            _tty_write(f"  Running: threads={threads}, mpi_procs={mpi_procs}\n")
+            result = self._run_script(threads, mpi_procs)
+            cache[key] = _RunMetrics.from_result(result)
+        self._check_cache_complete(cache)
+        return cache
 
     def _run_script(self, threads: int, mpi_procs: Optional[int]) -> OpenMCRunResult:
         import json
         import numbers
         import subprocess
-        import shutil
         import sys
         import tempfile
         from pathlib import Path
@@ -283,9 +618,6 @@ class _PythonBenchmark(_BaseBenchmark):
                 f"            json.dump(metrics, fh)\n"
             )
 
-            env = OpenMCRunner._build_environment(
-                os.environ, threads=threads, extra_env=None,
-            )
             # Ensure the project root (parent of the benchmarks package) is
             # on PYTHONPATH so the subprocess can resolve top-level imports
             # like ``benchmarks.scripts.foo``.
@@ -293,7 +625,11 @@ class _PythonBenchmark(_BaseBenchmark):
             paths = list(sys.path)
             if project_root not in paths:
                 paths.insert(0, project_root)
-            env["PYTHONPATH"] = os.pathsep.join(paths)
+            env = OpenMCRunner._build_environment(
+                os.environ,
+                threads=threads,
+                extra_env={"PYTHONPATH": os.pathsep.join(paths)},
+            )
 
             cmd: list[str] = []
             if mpi_procs is not None and mpi_procs > 1 and _MPI_RUNNER:
@@ -301,20 +637,6 @@ class _PythonBenchmark(_BaseBenchmark):
                 cmd.extend(["-np", str(mpi_procs)])
             cmd.extend([sys.executable, str(script_path)])
 
-            def _find_time_executable() -> str:
-                def _is_gnu_time(exe: str) -> bool:
-                    try:
-                        completed = subprocess.run([exe, "--version"], capture_output=True, text=True)
-                        return "GNU" in completed.stdout
-                    except Exception:
-                        return False
-
-                for exe in ("time", "gtime"):
-                    path = shutil.which(exe)
-                    if path and _is_gnu_time(path):
-                        return path
-                raise RuntimeError("GNU time with -v support not found")
-
             time_output = workdir / "time-usage.txt"
             full_cmd = [_find_time_executable(), "-v", "-o", str(time_output), *cmd]
 
@@ -399,6 +721,7 @@ def make_python_benchmark(
         "__doc__": f"Python benchmark for {name}.",
         "configs": config_options,
         "params": (config_options,),
+        "_keys": _config_keys(config_options),
         "_module_path": module_path,
         "_custom_metrics": custom_metrics or {},
         "_return_metrics": return_metric_names,
@@ -12,7 +12,9 @@ workflow can capture it for later termination.
 """
 
 import argparse
+import json
 from pathlib import Path
+import time
 
 import boto3
 
@@ -29,6 +31,10 @@ ROOT_VOLUME_GB  = 100
 USERDATA_TEMPLATE = Path(__file__).parent / "runner-userdata.sh"
 # ---------------------------------------------------------------------------
 
+# AMIs are immutable, so their description is cached between launches
+AMI_CACHE = Path.home() / ".cache" / "openmc-bench" / "ami_cache.json"
+AMI_CACHE_TTL_S = 30 * 24 * 3600
+
 
 def build_user_data(runner_token: str, runner_label: str, github_repo: str) -> str:
     """Read the runner-userdata.sh template and substitute variables."""
@@ -42,28 +48,63 @@ def build_user_data(runner_token: str, runner_label: str, github_repo: str) -> s
     return script
 
 
+def _load_ami_cache() -> dict:
+    try:
+        return json.loads(AMI_CACHE.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def describe_image(ec2_client) -> dict:
+    """Return the root device name and block device mappings of IMAGE_ID."""
+    cache = _load_ami_cache()
+    entry = cache.get(IMAGE_ID)
+    if entry and time.time() - entry.get("fetched", 0) < AMI_CACHE_TTL_S:
+        return entry
+
+    images = ec2_client.describe_images(ImageIds=[IMAGE_ID])["Images"]
+    if not images:
+        raise RuntimeError(f"AMI not found: {IMAGE_ID}")
+    entry = {
+        "RootDeviceName": images[0].get("RootDeviceName"),
+        "BlockDeviceMappings": images[0].get("BlockDeviceMappings", []),
+        "fetched": time.time(),
+    }
+    cache[IMAGE_ID] = entry
+    try:
+        AMI_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        AMI_CACHE.write_text(json.dumps(cache, indent=2))
+    except OSError:
+        pass
+    return entry
+
+
 def get_block_device_mappings(ec2_client) -> list:
-    """Copy the AMI's root device mapping, expanding the root volume."""
+    """Return a mapping override that expands the AMI's root volume.
+
+    Only the root device is specified; EC2 keeps the AMI's defaults for every
+    other mapping. An empty list means the root volume is already big enough.
+    """
     try:
-        images = ec2_client.describe_images(ImageIds=[IMAGE_ID])["Images"]
-        if not images:
-            raise RuntimeError(f"AMI not found: {IMAGE_ID}")
-        image = images[0]
-        root_device = image.get("RootDeviceName", "/dev/sda1")
-        mappings = []
-        for m in image.get("BlockDeviceMappings", []):
-            entry = {"DeviceName": m["DeviceName"]}
-            if "Ebs" in m:
-                ebs = dict(m["Ebs"])
-                if m["DeviceName"] == root_device:
-                    ebs["VolumeSize"] = max(ebs.get("VolumeSize", 8), ROOT_VOLUME_GB)
-                    ebs.setdefault("DeleteOnTermination", True)
-                    ebs.setdefault("VolumeType", "gp3")
-                entry["Ebs"] = ebs
-            elif "VirtualName" in m:
-                entry["VirtualName"] = m["VirtualName"]
-            mappings.append(entry)
-        return mappings
+        image = describe_image(ec2_client)
+        root_device = image.get("RootDeviceName") or "/dev/sda1"
+        root_ebs = next(
+            (m["Ebs"] for m in image.get("BlockDeviceMappings", [])
+             if m["DeviceName"] == root_device and "Ebs" in m),
+            {},
+        )
+        if root_ebs.get("VolumeSize", 8) >= ROOT_VOLUME_GB:
+            return []
+        ebs = {
+            "VolumeSize": ROOT_VOLUME_GB,
+            "VolumeType": root_ebs.get("VolumeType", "gp3"),
+            "DeleteOnTermination": True,
+        }
+        # Provisioned volume types must restate their performance settings
+        for key in ("Iops", "Throughput"):
+            if key in root_ebs:
+                ebs[key] = root_ebs[key]
+        return [{"DeviceName": root_device, "Ebs": ebs}]
     except Exception:
         return [{
             "DeviceName": "/dev/sda1",
@@ -78,7 +119,12 @@ def get_block_device_mappings(ec2_client) -> list:
 def wait_for_running(ec2_client, instance_id: str) -> dict:
     print(f"Waiting for {instance_id} to enter 'running' state…", flush=True)
     waiter = ec2_client.get_waiter("instance_running")
-    waiter.wait(InstanceIds=[instance_id])
+    # The default waiter polls every 15 s; instances typically start within
+    # tens of seconds, so poll more often (same ~10 min overall timeout)
+    waiter.wait(
+        InstanceIds=[instance_id],
+        WaiterConfig={"Delay": 5, "MaxAttempts": 120},
+    )
     desc = ec2_client.describe_instances(InstanceIds=[instance_id])
     return desc["Reservations"][0]["Instances"][0]
 
@@ -106,12 +152,14 @@ def main():
             args.runner_label,
             args.github_repo
         ),
-        BlockDeviceMappings=get_block_device_mappings(ec2),
         TagSpecifications=[{
             "ResourceType": "instance",
             "Tags": [{"Key": "Name", "Value": "openmc-perf-runner"}],
         }],
     )
+    block_device_mappings = get_block_device_mappings(ec2)
+    if block_device_mappings:
+        run_kwargs["BlockDeviceMappings"] = block_device_mappings
     if KEYPAIR_NAME:
         run_kwargs["KeyName"] = KEYPAIR_NAME
 